@@ -100,8 +100,12 @@ class ScanProgressDialog(wx.Dialog):
         if self.cancelled:
             return
             
-        # Use CallAfter to ensure UI updates happen on main thread
-        wx.CallAfter(self._update_progress_ui, library_name, progress, games_found)
+        # Update directly when already on the main thread (the scan poll timer),
+        # otherwise marshal through CallAfter
+        if wx.IsMainThread():
+            self._update_progress_ui(library_name, progress, games_found)
+        else:
+            wx.CallAfter(self._update_progress_ui, library_name, progress, games_found)
     
     def _update_progress_ui(self, library_name, progress, games_found):
         """Update progress UI on main thread"""
@@ -224,6 +228,7 @@ class FirstTimeSetupDialog(wx.Dialog):
         dlg = GameDialog(self, self.library_manager)
         if dlg.ShowModal() == wx.ID_OK:
             self.library_manager.games.append(dlg.game)
+            self.library_manager.mark_games_changed()
             self.library_manager.save_games()
             self.check_and_show_reminder()
         dlg.Destroy()
@@ -285,7 +290,7 @@ class GameDialog(wx.Dialog):
         self.platform_ctrl = wx.ComboBox(panel, choices=platforms, style=wx.CB_DROPDOWN | wx.CB_READONLY)
 
         # Determine initial platform
-        if self.game.launch_path.startswith("http"):
+        if self.game.is_web:
             initial_platform = "Web Game"
         elif self.game.platforms:
             initial_platform = self.game.platforms[0]
@@ -357,7 +362,7 @@ class GameDialog(wx.Dialog):
         if not self.game.launch_path:
             return ""
 
-        if self.game.launch_path.startswith("http"):
+        if self.game.is_web:
             return self.game.launch_path
 
         if self.game.library_name and self.game.library_name != "":
@@ -487,6 +492,7 @@ class GameDialog(wx.Dialog):
         # Normalize the path for comparison
         from pathlib import Path
         normalized_path = str(Path(path).resolve())
+        paths_by_name = self.library_manager.library_paths_by_name()
 
         for game in self.library_manager.games:
             if game == self.game:  # Skip the current game if editing
@@ -501,11 +507,11 @@ class GameDialog(wx.Dialog):
                 }
 
             # For non-web games, also check resolved absolute paths
-            if not path.startswith('http') and not game.launch_path.startswith('http'):
+            if not path.startswith('http') and not game.is_web:
                 try:
                     if game.library_name and game.library_name != "":
                         # Library game - resolve to absolute path
-                        game_full_path = self.library_manager.get_full_path(game)
+                        game_full_path = self.library_manager.get_full_path(game, paths_by_name)
                         if game_full_path:
                             game_resolved = str(Path(game_full_path).resolve())
                             if game_resolved == normalized_path:
@@ -569,12 +575,13 @@ class GameDialog(wx.Dialog):
         self.game.genre = self.genre_ctrl.GetValue().strip()
         self.game.developer = self.developer_ctrl.GetValue().strip()
         self.game.year = year_str or ""
+        self.game.invalidate_cache()
 
         # Handle platform and path
         if platform_val == "Web Game":
-            self.game.platforms = ["Web"]
+            self.game.platforms = ("Web",)
         else:
-            self.game.platforms = [platform_val]
+            self.game.platforms = (platform_val,)
 
         # Handle library_name based on path changes
         if self.is_new:
@@ -603,6 +610,10 @@ class PreferencesDialog(wx.Dialog):
 
         self.library_manager = library_manager
 
+        # Set by on_apply so the main window only refreshes what actually changed
+        self.libraries_changed = False
+        self.games_changed = False
+
         # Create notebook
         self.notebook = wx.Notebook(self)
 
@@ -846,6 +857,7 @@ class PreferencesDialog(wx.Dialog):
         exceptions_changed = old_exceptions != new_exceptions
 
         self.library_manager.save_config()
+        self.libraries_changed = self.libraries_changed or libs_changed
 
         if libs_changed and self.library_manager.config["libraries"]:
             # Determine which libraries are completely new
@@ -869,6 +881,7 @@ class PreferencesDialog(wx.Dialog):
 
             try:
                 # Use unified scanning - method will handle new libraries intelligently
+                self.games_changed = True
                 result = self.library_manager.scan_with_dialog(
                     self.GetParent(),
                     new_libraries_added if new_libraries_added else None
@@ -899,6 +912,7 @@ class PreferencesDialog(wx.Dialog):
                 wx.MessageBox(str(e), "Permission Denied", wx.OK | wx.ICON_ERROR)
         elif exceptions_changed:
             # Only exceptions changed, not libraries - run cleanConfigs directly
+            self.games_changed = True
             self.library_manager.cleanConfigs()
 
             # Refresh the exceptions list to show cleaned exceptions
@@ -71,6 +71,8 @@ class GameListCtrl:
                     # Access underlying control to set column width
                     self.list.control.control.SetColumnWidth(i, width)
 
+        self.update_sort_indicators()
+
         # Bind events - use underlying control for column clicks
         # Context menu, selection, activation need to be bound by MainFrame after init
         self.list.control.control.Bind(wx.EVT_LIST_COL_CLICK, self.on_column_click)
@@ -95,16 +97,18 @@ class GameListCtrl:
     def populate(self, games):
         """Populate virtual list with games"""
         self.games_displayed = games
+        # sort_list() refreshes the virtual list; only an empty list skips that
         self.sort_list()
-        # Update the virtual list count
-        self.list.update_count(len(self.games_displayed))
+        if not self.games_displayed:
+            self.list.update_count(0)
     
     def sort_list(self):
         """Sort the list by current column and direction"""
         if not self.games_displayed:
             return
 
-        # Sort games in-place
+        # Sort games in-place (games arrive in title order, see
+        # GameLibraryManager.sort_games_by_title(), so the title sort is cheap)
         if self.sort_column == 0:  # Title
             self.games_displayed.sort(key=lambda g: g.title.lower(),
                                      reverse=not self.sort_ascending)
@@ -125,7 +129,12 @@ class GameListCtrl:
         if self.games_displayed:
             self.list.update_count(len(self.games_displayed))
 
-        # Update column headers with arrows (not supported on DataViewCtrl)
+    def update_sort_indicators(self):
+        """Show the sort direction arrow on the sorted column header
+
+        Called when the sort changes rather than on every populate.
+        """
+        # Not supported on DataViewCtrl
         if not self.is_dataview:
             for col in range(self.GetColumnCount()):
                 info = self.list.control.control.GetColumn(col)
@@ -145,6 +154,7 @@ class GameListCtrl:
             self.sort_ascending = True
 
         self.sort_list()
+        self.update_sort_indicators()
 
         # Save state
         self.library_manager.config["SavedState"]["sort_column"] = self.sort_column
@@ -163,6 +173,7 @@ class GameListCtrl:
                     self.sort_column = col
                     self.sort_ascending = True
                 self.sort_list()
+                self.update_sort_indicators()
 
                 # Save state
                 self.library_manager.config["SavedState"]["sort_column"] = self.sort_column
@@ -179,12 +190,11 @@ class GameListCtrl:
         return None
 
     def save_column_widths(self):
-        """Save current column widths"""
+        """Store current column widths in config (the caller writes the file)"""
         widths = []
         for i in range(self.GetColumnCount()):
             widths.append(self.GetColumnWidth(i))
         self.library_manager.config["SavedState"]["column_widths"] = widths
-        self.library_manager.save_config()
 
     # Wrapper methods to maintain compatibility with MainFrame
     def GetColumnCount(self):
@@ -23,8 +23,12 @@ import json
 import os
 import sys
 import platform
+import stat
+import tempfile
 import threading
+import time
 import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
 
@@ -32,25 +36,42 @@ from models import Game
 from exception_manager import ExceptionManager
 from path_manager import PathManager
 
+# Imported on first scan so this module still loads without wxPython
+_ScanProgressDialog = None
+
+# Read once at import (os.umask can only be read by setting it); new files
+# written by _write_json() get the mode open() would have given them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class GameLibraryManager:
     """Handles all game library operations and data management"""
     
     # Constants for scanning behavior
     MAX_SCAN_DEPTH = 10
+    PROGRESS_UPDATE_INTERVAL = 1 / 30  # Seconds between progress dialog updates
+    RESOLVED_PATH_TTL = 5.0  # Seconds a verified game path is trusted without another stat
     VALID_GAME_NAMES = ["game", "launch", "play", "start", "run"]
+    GAMES_SCHEMA = 1  # games.json format: {"schema", "fields", "rows"} with one row per game
     
     def __init__(self):
         self.games = []
+        self.revision = 0  # Bumped by mark_games_changed()
+        self._last_written = {}  # File path -> bytes last written by _write_json()
+        self._write_lock = threading.Lock()  # The scan thread and UI timers both save files
         self.config = {}
         self.app_dir = Path(os.path.dirname(os.path.abspath(sys.argv[0])))
         self.games_file = self.app_dir / "games.json"
+        self.scan_cache_file = self.app_dir / "scan_cache.json"
         self.config_file = self.get_config_path()
         self.is_first_run = not self.config_file.exists()
         self.exception_manager = ExceptionManager()
         self.path_manager = PathManager()
+        self._scan_pool = ThreadPoolExecutor(max_workers=1)  # Reused for every background scan
         self.load_config()
         self.load_games()
+        self.load_scan_cache()
         self.cleanConfigs()
         self._last_auto_exception_count = 0
     
@@ -90,7 +111,7 @@ class GameLibraryManager:
         
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
                     loaded = json.load(f)
                     # Merge with defaults to ensure all keys exist
                     for key in default_config:
@@ -109,8 +130,50 @@ class GameLibraryManager:
     
     def save_config(self):
         """Save configuration to JSON file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        self._write_json(self.config_file, self.config)
+
+    @property
+    def non_manual_libs(self):
+        """Configured libraries excluding the built-in "manual" entry
+
+        Not cached: the preferences dialog edits config["libraries"] in place.
+        """
+        return [lib for lib in self.config["libraries"] if lib["name"] != "manual"]
+
+    def _write_json(self, path, data, indent=True):
+        """Write data as JSON to a temp file, then atomically replace path.
+
+        Non-ASCII text is escaped, so the file is plain ASCII whatever the
+        locale. Skips the write when the output matches what was last written
+        to path. Safe to call from the scan thread and the UI thread at once.
+        """
+        content = json.dumps(data, indent=2 if indent else None).encode()
+
+        with self._write_lock:
+            if self._last_written.get(path) == content and path.exists():
+                return
+
+            # Each write gets its own temp file, in the same directory so the
+            # replace stays on one filesystem
+            tmp_file = tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name + ".",
+                                                   suffix=".tmp", delete=False)
+            try:
+                with tmp_file:
+                    tmp_file.write(content)
+                # Temp files are created owner-only; keep the file's usual mode
+                try:
+                    mode = stat.S_IMODE(os.stat(path).st_mode)
+                except FileNotFoundError:
+                    mode = 0o666 & ~_UMASK
+                os.chmod(tmp_file.name, mode)
+                os.replace(tmp_file.name, path)
+            except OSError:
+                try:
+                    os.unlink(tmp_file.name)
+                except OSError:
+                    pass
+                raise
+            self._last_written[path] = content
 
     def _normalize_exception_entry(self, entry: str) -> str:
         return self.path_manager.normalize(entry)
@@ -210,18 +273,97 @@ class GameLibraryManager:
         """Load games from JSON file"""
         if self.games_file.exists():
             try:
-                with open(self.games_file, 'r') as f:
+                with open(self.games_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.games = [Game.from_dict(g) for g in data]
+                self.games = self._games_from_data(data)
             except:
                 self.games = []
         else:
             self.games = []
+        self.sort_games_by_title()
+        self.mark_games_changed()
+
+    def sort_games_by_title(self):
+        """Keep games in the game list's default (title) order.
+
+        Done after bulk loads and scans; filtering preserves this order, so the
+        list's title sort then finds its input already (nearly) sorted.
+        """
+        self.games.sort(key=lambda g: g.title.lower())
+
+    def _games_from_data(self, data):
+        """Build games from loaded games.json data
+
+        An entry that can't be read is skipped with a warning, so one bad row
+        doesn't cost the rest of the library.
+        """
+        if isinstance(data, list):
+            # Written before the row format: one dict per game
+            make_game, entries = Game.from_dict, data
+        elif data.get("schema") == self.GAMES_SCHEMA and data["fields"] == list(Game.ROW_FIELDS):
+            make_game, entries = Game.from_row, data["rows"]
+        else:
+            # Another schema version or field order; match values to field names
+            fields = data["fields"]
+
+            def make_game(row):
+                if len(row) != len(fields):
+                    raise ValueError("row length doesn't match fields")
+                return Game.from_dict(dict(zip(fields, row)))
+
+            entries = data["rows"]
+
+        games = []
+        for entry in entries:
+            try:
+                games.append(make_game(entry))
+            except (TypeError, ValueError, AttributeError):
+                print(f"Warning: Skipping unreadable game in games.json: {entry!r}")
+        return games
+
+    def mark_games_changed(self):
+        """Record that games were added, removed or edited.
+
+        Anything cached from the games list (such as the main window's filter
+        index) compares against revision to know when to rebuild.
+        """
+        self.revision += 1
     
     def save_games(self):
-        """Save games to JSON file"""
-        with open(self.games_file, 'w') as f:
-            json.dump([g.to_dict() for g in self.games], f, indent=2)
+        """Save games to JSON file
+
+        Each game is a row of values in Game.ROW_FIELDS order, so field names
+        are written once instead of once per game.
+        """
+        self._write_json(self.games_file, {
+            "schema": self.GAMES_SCHEMA,
+            "fields": Game.ROW_FIELDS,
+            "rows": [g.to_row() for g in self.games]
+        })
+
+    def load_scan_cache(self):
+        """Load the directory mtime cache used by incremental scans"""
+        self.dir_mtime_cache = {}
+        self._scan_cache_exceptions = []
+        self._scan_cache_dirty = False
+        if self.scan_cache_file.exists():
+            try:
+                with open(self.scan_cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    self.dir_mtime_cache = data.get("dirs", {})
+                    self._scan_cache_exceptions = data.get("exceptions", [])
+            except:
+                self.dir_mtime_cache = {}
+                self._scan_cache_exceptions = []
+
+    def save_scan_cache(self):
+        """Save the directory mtime cache next to games.json"""
+        self._scan_cache_exceptions = list(self.config.get("exceptions", []))
+        self._scan_cache_dirty = False
+        self._write_json(self.scan_cache_file, {
+            "exceptions": self._scan_cache_exceptions,
+            "dirs": self.dir_mtime_cache
+        }, indent=False)
 
     def cleanConfigs(self, progress_callback=None):
         """Clean configuration by removing games with paths in exceptions and redundant exceptions.
@@ -235,20 +377,17 @@ class GameLibraryManager:
         if progress_callback:
             progress_callback("Cleaning configuration...", 0, len(self.games))
 
-        # Remove games with paths matching exceptions
-        original_game_count = len(self.games)
-        games_to_remove = []
-
-        for game in self.games:
-            if game.launch_path and self._is_path_exception(game.launch_path):
-                games_to_remove.append(game)
+        # Remove games with paths matching exceptions (one pass, in place)
+        kept_games = [game for game in self.games
+                      if not (game.launch_path and self._is_path_exception(game.launch_path))]
+        removed_game_count = len(self.games) - len(kept_games)
 
-        if games_to_remove:
-            for game in games_to_remove:
-                self.games.remove(game)
+        if removed_game_count:
+            self.games[:] = kept_games
+            self.mark_games_changed()
             games_changed = True
             if progress_callback:
-                progress_callback(f"Removed {len(games_to_remove)} games matching exceptions", 0, len(self.games))
+                progress_callback(f"Removed {removed_game_count} games matching exceptions", 0, len(self.games))
 
         # Remove redundant file exceptions covered by folder exceptions
         exceptions = self.config.get("exceptions", [])
@@ -271,10 +410,11 @@ class GameLibraryManager:
                     redundant_exceptions.append(file_exc)
                     break
 
-        # Remove redundant exceptions
+        # Remove redundant exceptions (one pass, in place)
         if redundant_exceptions:
-            for exc in redundant_exceptions:
-                self.config["exceptions"].remove(exc)
+            redundant = set(redundant_exceptions)
+            self.config["exceptions"][:] = [exc for exc in self.config["exceptions"]
+                                            if exc not in redundant]
             exceptions_changed = True
             if progress_callback:
                 progress_callback(f"Removed {len(redundant_exceptions)} redundant exceptions", 0, len(self.games))
@@ -295,13 +435,68 @@ class GameLibraryManager:
                 return lib["path"]
         return None
     
-    def get_full_path(self, game):
-        """Construct full path from relative path and library"""
+    def find_library_for_path(self, path):
+        """Find the configured library that contains an absolute path
+
+        Matches whole path components, so "D:/Games2" is not inside "D:/Games".
+        When libraries are nested the deepest one wins.
+
+        Returns:
+            dict: The library config entry, or None if path is in no library
+        """
+        comparison_key = self.path_manager.comparison_key
+        path_key = comparison_key(path)
+        best_library = None
+        best_length = -1
+
+        for lib in self.non_manual_libs:
+            lib_key = comparison_key(lib["path"])
+            if len(lib_key) <= best_length:
+                continue
+            if path_key == lib_key or path_key.startswith(os.path.join(lib_key, "")):
+                best_library = lib
+                best_length = len(lib_key)
+
+        return best_library
+
+    def get_existing_full_path(self, game):
+        """Get a game's full path if the file exists, else None
+
+        A path verified within RESOLVED_PATH_TTL seconds is reused without
+        touching the disk, so repeated launches don't stat again.
+        """
+        full_path = self.get_full_path(game)
+        if not full_path:
+            return None
+
+        # Compared with the path built from the current library paths, so a
+        # library moved in Preferences isn't served from the cache
+        if game.get_cached_full_path(self.RESOLVED_PATH_TTL) == full_path:
+            return full_path
+
+        if not Path(full_path).exists():
+            return None
+        game.set_cached_full_path(full_path)
+        return full_path
+
+    def get_full_path(self, game, paths_by_name=None):
+        """Construct full path from relative path and library
+
+        Loops over many games pass paths_by_name from library_paths_by_name().
+        """
         return self.path_manager.get_full_path(
             game.launch_path,
             self.config["libraries"],
-            game.library_name
+            game.library_name,
+            paths_by_name
         )
+
+    def library_paths_by_name(self):
+        """Map library name -> path; the first library wins, as in get_full_path()"""
+        paths_by_name = {}
+        for lib in self.config["libraries"]:
+            paths_by_name.setdefault(lib["name"], lib["path"])
+        return paths_by_name
     
     def is_executable(self, path):
         """Check if file is an executable based on platform and extension"""
@@ -374,24 +569,25 @@ class GameLibraryManager:
             list: List of validated games that still exist
         """
         validated_games = []
+        paths_by_name = self.library_paths_by_name()
         
         for game in self.games:
             if cancel_check and cancel_check():
                 break
                 
             # Always keep web games
-            if game.launch_path.startswith("http"):
+            if game.is_web:
                 validated_games.append(game)
                 continue
             
             # Always keep user-managed games (they manage their own paths)
-            if game.library_name == "manual" or game.library_name == "":
+            if game.is_manual:
                 validated_games.append(game)
                 continue
             
             # Only keep games from libraries that still exist
             if game.library_name in valid_library_names:
-                full_path = self.get_full_path(game)
+                full_path = self.get_full_path(game, paths_by_name)
                 if full_path and Path(full_path).exists() and self.is_executable(full_path):
                     validated_games.append(game)
         
@@ -407,11 +603,12 @@ class GameLibraryManager:
             set: Set of directory paths that contain known games
         """
         known_game_dirs = set()
+        paths_by_name = self.library_paths_by_name()
         
         for game in validated_games:
-            if not game.launch_path.startswith("http") and game.library_name != "manual" and game.library_name != "":
+            if not game.is_web and not game.is_manual:
                 try:
-                    full_path = self.get_full_path(game)
+                    full_path = self.get_full_path(game, paths_by_name)
                     if full_path:
                         game_dir = str(Path(full_path).parent)
                         known_game_dirs.add(game_dir)
@@ -424,6 +621,16 @@ class GameLibraryManager:
                      progress_callback=None, cancel_check=None):
         """Recursively scan a library path for games.
 
+        This is a generator so callers can merge games while the scan is still
+        walking the library. Auto exceptions found along the way are added to
+        config["exceptions"] as they are found.
+
+        Incremental scans reuse the cached listing of a directory whose mtime is
+        unchanged. A directory's mtime only changes when entries are added,
+        removed or renamed directly in it, so a file made executable in place
+        (chmod, or overwritten under the same name) isn't noticed until that
+        directory changes or a full scan runs; full scans never use the cache.
+
         Args:
             library_path: Path to library directory to scan
             library_name: Name of the library
@@ -432,11 +639,13 @@ class GameLibraryManager:
             progress_callback: Optional progress callback function
             cancel_check: Optional cancellation check function
 
-        Returns:
-            tuple[list[Game], int]: Newly discovered games and number of auto exceptions added.
+        Yields:
+            Game: Each game as it is discovered
         """
         if max_depth is None:
             max_depth = self.MAX_SCAN_DEPTH
+        # Cached directory listings are only trusted for incremental scans
+        use_dir_cache = known_game_dirs is not None
         if known_game_dirs is None:
             known_game_dirs = set()
             
@@ -444,15 +653,47 @@ class GameLibraryManager:
         library_path_obj = Path(library_path)
         if not library_path_obj.exists():
             print(f"Warning: Library path '{library_path}' does not exist. Skipping scan.")
-            return [], []
+            return
         
         if not library_path_obj.is_dir():
             print(f"Warning: Library path '{library_path}' is not a directory. Skipping scan.")
-            return [], []
+            return
 
-        found_games = []
+        games_found = 0
         directories_to_scan = []
-        auto_exceptions_added = 0
+        listings = {}
+        visited_dirs = set()
+
+        def list_directory(path):
+            """Get (mtime_ns, subdirectory names, unchanged) for a directory.
+
+            A directory whose mtime matches the cache and which held no games
+            last time has the same children, so its cached subdirectory names
+            are reused and its executables don't need to be collected again.
+            """
+            key = str(path)
+            if key not in listings:
+                mtime_ns = os.stat(key).st_mtime_ns
+                cached = self.dir_mtime_cache.get(key)
+                if use_dir_cache and cached and cached[0] == mtime_ns and not cached[1]:
+                    listings[key] = (mtime_ns, cached[2], True)
+                else:
+                    listings[key] = (mtime_ns, self._read_subdirectories(path), False)
+            return listings[key]
+
+        def subdirectories_to_scan(path):
+            """Yield subdirectories of path that are not excluded or already known"""
+            _, subdir_names, _ = list_directory(path)
+            for name in subdir_names:
+                item = Path(path) / name
+                # Check if this directory is excluded by folder exceptions
+                rel_path = item.relative_to(library_path_obj)
+                rel_str = self.path_manager.normalize(rel_path)
+                if self._is_path_exception(rel_str):
+                    continue
+                # Only scan if not a known game directory (for incremental scanning)
+                if str(item) not in known_game_dirs:
+                    yield item
 
         # First pass: collect all directories to get total count for progress
         if progress_callback:
@@ -460,22 +701,9 @@ class GameLibraryManager:
                 if depth > max_depth or (cancel_check and cancel_check()):
                     return
                 try:
-                    for item in Path(path).iterdir():
-                        if item.name.startswith('.') or item.is_symlink():
-                            continue
-                        if item.is_dir():
-                            # Skip .app bundles on macOS - they're executables, not folders to scan
-                            if item.suffix.lower() == '.app':
-                                continue
-                            # Check if this directory is excluded by folder exceptions
-                            rel_path = item.relative_to(Path(library_path))
-                            rel_str = self.path_manager.normalize(rel_path)
-                            if self._is_path_exception(rel_str):
-                                continue
-                            # Only add to scan list if not a known game directory (for incremental scanning)
-                            if str(item) not in known_game_dirs:
-                                directories_to_scan.append(str(item))
-                                collect_directories(item, depth + 1)
+                    for item in subdirectories_to_scan(path):
+                        directories_to_scan.append(str(item))
+                        collect_directories(item, depth + 1)
                 except (PermissionError, OSError):
                     pass
             collect_directories(library_path)
@@ -483,7 +711,7 @@ class GameLibraryManager:
         directories_processed = 0
 
         def scan_recursive(path, depth=0):
-            nonlocal directories_processed, auto_exceptions_added
+            nonlocal directories_processed, games_found
 
             if depth > max_depth or (cancel_check and cancel_check()):
                 return
@@ -495,13 +723,18 @@ class GameLibraryManager:
             # Update progress
             if progress_callback and directories_to_scan:
                 progress = (directories_processed / len(directories_to_scan)) * 100
-                progress_callback(library_name, progress, len(found_games))
+                progress_callback(library_name, progress, games_found)
                 directories_processed += 1
             
             try:
+                mtime_ns, subdir_names, unchanged = list_directory(path)
+                visited_dirs.add(str(path))
+
                 # Collect executables in this directory (also handles auto-exception counting)
-                executables, exceptions_added = self._collect_executables_with_exceptions(Path(path), library_path)
-                auto_exceptions_added += exceptions_added
+                if unchanged:
+                    executables = []
+                else:
+                    executables, _ = self._collect_executables_with_exceptions(Path(path), library_path)
 
                 if executables:
                     # Calculate depth of game directory relative to library root for hierarchical field extraction
@@ -540,61 +773,56 @@ class GameLibraryManager:
                         if cancel_check and cancel_check():
                             return
 
-                        # Check if game already exists
-                        existing = None
-                        for g in found_games:
-                            if g.launch_path == rel_str:
-                                existing = g
-                                break
-
-                        if existing:
-                            # Update platforms if needed based on file type
-                            if exe_path.suffix.lower() == '.app':
-                                platform_name = "macOS"
-                            elif exe_path.suffix.lower() in ['.exe', '.bat']:
-                                platform_name = "Windows"
-                            else:
-                                platform_name = "macOS" if exe_path.is_dir() else "Windows"
-
-                            if platform_name not in existing.platforms:
-                                existing.platforms.append(platform_name)
-                        else:
-                            # Create new game
-                            game = self._create_game_from_executable(
-                                exe_path, rel_str, library_name,
-                                directory_name, len(executables) > 1, developer_name, genre_name
-                            )
-                            found_games.append(game)
+                        # Each directory is visited once, so every executable is a new
+                        # game here; _merge_games handles games already in the library
+                        games_found += 1
+                        yield self._create_game_from_executable(
+                            exe_path, rel_str, library_name,
+                            directory_name, len(executables) > 1, developer_name, genre_name
+                        )
                 
+                # Remember the listing so unchanged directories can be skipped next time
+                entry = [mtime_ns, bool(executables), subdir_names]
+                if self.dir_mtime_cache.get(str(path)) != entry:
+                    self.dir_mtime_cache[str(path)] = entry
+                    self._scan_cache_dirty = True
+
                 # Continue recursing into subdirectories
-                for item in Path(path).iterdir():
+                for item in subdirectories_to_scan(path):
                     # Check for cancellation
                     if cancel_check and cancel_check():
                         return
-                        
-                    if item.name.startswith('.'):
-                        continue
-                    if item.is_symlink():
-                        continue
-                    if item.is_dir():
-                        # Skip .app bundles on macOS - they're executables, not folders to scan
-                        if item.suffix.lower() == '.app':
-                            continue
-                        # Check if this directory is excluded by folder exceptions
-                        rel_path = item.relative_to(Path(library_path))
-                        rel_str = self.path_manager.normalize(rel_path)
-                        if self._is_path_exception(rel_str):
-                            continue
-                        # Only recurse if not a known game directory (for incremental scanning)
-                        if str(item) not in known_game_dirs:
-                            scan_recursive(item, depth + 1)
+                    yield from scan_recursive(item, depth + 1)
             
             except PermissionError:
                 # Handle permission errors
                 raise PermissionError(f"Permission denied: {path}")
         
-        scan_recursive(library_path)
-        return found_games, auto_exceptions_added
+        yield from scan_recursive(library_path)
+
+        # Drop cache entries for directories of this library that no longer exist
+        if not (cancel_check and cancel_check()):
+            prefix = os.path.join(str(library_path_obj), "")
+            for key in [k for k in self.dir_mtime_cache
+                        if k.startswith(prefix) and k not in visited_dirs
+                        and not os.path.isdir(k)]:
+                del self.dir_mtime_cache[key]
+                self._scan_cache_dirty = True
+
+    def _read_subdirectories(self, path):
+        """List the names of subdirectories that may contain games"""
+        names = []
+        # scandir entries carry the file type from the directory read, so this
+        # needs no per-entry stat calls
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or entry.is_symlink():
+                    continue
+                # Skip .app bundles on macOS - they're executables, not folders to scan
+                if entry.is_dir() and os.path.splitext(name)[1].lower() != '.app':
+                    names.append(name)
+        return names
 
     def _collect_executables_with_exceptions(self, directory_path, library_path):
         """
@@ -606,19 +834,19 @@ class GameLibraryManager:
         executables = []
         exceptions_added = 0
 
-        for item in directory_path.iterdir():
-            if item.name.startswith('.'):
-                continue
-            if item.is_symlink():
-                continue
-            # Skip directories unless they are .app bundles on macOS
-            if not item.is_file() and not (item.suffix.lower() == '.app' and item.is_dir()):
-                continue
+        # Read the directory in one go; DirEntry type checks need no extra stat
+        with os.scandir(directory_path) as entries:
+            candidates = [entry for entry in entries
+                          if not entry.name.startswith('.') and not entry.is_symlink()]
 
-            # Check if it's an executable
-            if not self.is_executable(str(item)):
+        is_executable = self.path_manager.is_executable
+        for entry in candidates:
+            # Executables and .app bundles, checked on the DirEntry itself
+            if not is_executable(entry):
                 continue
 
+            item = Path(entry.path)
+
             # Get relative path
             rel_path = item.relative_to(Path(library_path))
             rel_str = self.path_manager.normalize(rel_path)
@@ -707,32 +935,66 @@ class GameLibraryManager:
             title=title,
             genre=genre_name,
             developer=developer_name,
-            platforms=[platform_name],
+            platforms=(platform_name,),
             launch_path=rel_path_str,
             library_name=library_name
         )
 
-    def _merge_games(self, existing_games, new_games, cancel_check=None):
-        """Merge new games into existing games list, updating platforms if needed."""
+    def _index_games_by_path(self, games):
+        """Map each game's comparison-normalized launch path to the game (first wins)"""
+        comparison_key = self.path_manager.comparison_key
+        games_by_path = {}
+        for game in games:
+            games_by_path.setdefault(comparison_key(game.launch_path), game)
+        return games_by_path
+
+    def _merge_games(self, existing_games, new_games, cancel_check=None, games_by_path=None):
+        """Merge new games into existing games list, updating platforms if needed.
+
+        Args:
+            existing_games: List of games to merge into (modified in place)
+            new_games: Iterable of games found by a scan (may be a scan_library generator)
+            cancel_check: Optional callback to check for cancellation
+            games_by_path: Optional index from _index_games_by_path(existing_games);
+                kept up to date so callers merging several libraries can reuse it
+
+        Returns:
+            tuple: (completed, changed) - completed is False if cancelled,
+            changed is True if any game was added or updated
+        """
+        changed = False
+        comparison_key = self.path_manager.comparison_key
+
+        # Index existing games by launch path once instead of searching per new game
+        if games_by_path is None:
+            games_by_path = self._index_games_by_path(existing_games)
+
+        # Bound once: this loop runs for every game a scan finds
+        lookup = games_by_path.get
+        append = existing_games.append
+
         for new_game in new_games:
             if cancel_check and cancel_check():
-                return False
+                return False, changed
 
             # Find existing game with same launch path
-            existing = None
-            for game in existing_games:
-                if game.launch_path == new_game.launch_path:
-                    existing = game
-                    break
+            key = comparison_key(new_game.launch_path)
+            existing = lookup(key)
 
             if existing:
                 # Replace platform based on current file type (don't accumulate)
                 # This fixes incorrect platform detection from previous scans
-                existing.platforms = new_game.platforms
+                # Compared as sets so a reordered list isn't treated as a change
+                new_platforms = new_game.platforms
+                if set(existing.platforms) != set(new_platforms):
+                    existing.platforms = new_platforms
+                    changed = True
             else:
-                existing_games.append(new_game)
+                append(new_game)
+                games_by_path[key] = new_game
+                changed = True
 
-        return True
+        return True, changed
 
     def validate_and_scan(self, libraries_to_scan=None, progress_callback=None, cancel_check=None):
         """
@@ -754,6 +1016,7 @@ class GameLibraryManager:
             valid_library_names = {lib["name"] for lib in valid_libraries}
             validated_games = self._validate_existing_games(valid_library_names, cancel_check)
             self.games = validated_games
+            self.mark_games_changed()
             self.save_games()
             self._last_auto_exception_count = 0
             return removed_libraries
@@ -769,10 +1032,19 @@ class GameLibraryManager:
         if len(validated_games) < original_count and progress_callback:
             progress_callback(f"Removed {original_count - len(validated_games)} games matching exceptions", 0, len(validated_games))
 
+        # Only persist at the end if validation or scanning actually changed something
+        games_changed = len(validated_games) != len(self.games)
+
         if cancel_check and cancel_check():
             self._last_auto_exception_count = 0
             return []
 
+        # Cached listings can't reveal executables whose exceptions were removed
+        current_exceptions = set(self.config.get("exceptions", []))
+        if not current_exceptions.issuperset(self._scan_cache_exceptions):
+            self.dir_mtime_cache.clear()
+            self._scan_cache_dirty = True
+
         # Step 3: Determine scanning strategy
         # If games.json doesn't exist, do full scan (no optimization)
         # Otherwise, build known_game_dirs for incremental scanning
@@ -787,13 +1059,18 @@ class GameLibraryManager:
             libraries_to_process = valid_libraries
 
         # Step 5: Scan libraries
+        # Scans only ever append auto exceptions, so the growth of the list is the count
+        exception_count_before = len(self.config["exceptions"])
         total_auto_exceptions = 0
+        libraries_with_games = {g.library_name for g in validated_games}
+        games_by_path = None  # Built on first merge, then shared across libraries
         for lib in libraries_to_process:
             if cancel_check and cancel_check():
                 self._last_auto_exception_count = total_auto_exceptions
                 return []
 
-            if lib["name"] == "manual":
+            lib_name = lib["name"]
+            if lib_name == "manual":
                 continue  # Skip manual library
 
             try:
@@ -801,33 +1078,48 @@ class GameLibraryManager:
                 use_incremental = known_game_dirs is not None
 
                 # If specific libraries were requested and this is a new one, don't use incremental
-                if libraries_to_scan and lib["name"] in libraries_to_scan:
+                if libraries_to_scan and lib_name in libraries_to_scan:
                     # Check if this library has any existing games
-                    has_existing_games = any(g.library_name == lib["name"] for g in validated_games)
-                    if not has_existing_games:
+                    if lib_name not in libraries_with_games:
                         use_incremental = False
 
-                new_games, added_exceptions = self.scan_library(
+                new_games = self.scan_library(
                     lib["path"],
-                    lib["name"],
+                    lib_name,
                     known_game_dirs=known_game_dirs if use_incremental else None,
                     progress_callback=progress_callback,
                     cancel_check=cancel_check
                 )
-                total_auto_exceptions += added_exceptions
 
-                # Merge new games
-                if not self._merge_games(validated_games, new_games, cancel_check):
+                # Merge games as the scan yields them
+                if games_by_path is None:
+                    games_by_path = self._index_games_by_path(validated_games)
+                completed, merged_changes = self._merge_games(validated_games, new_games, cancel_check,
+                                                              games_by_path)
+                new_games.close()
+                games_changed = games_changed or merged_changes
+                total_auto_exceptions = len(self.config["exceptions"]) - exception_count_before
+                if not completed:
+                    # Games merged before the cancel were updated in place
+                    if games_changed:
+                        self.mark_games_changed()
                     self._last_auto_exception_count = total_auto_exceptions
                     return []  # Cancelled during merge
 
             except PermissionError as e:
                 raise e
 
-        # Step 6: Save results
+        # Step 6: Save results (skip writes on scans that found nothing new)
         self.games = validated_games
-        self.save_games()
-        self.save_config()
+        if games_changed:
+            self.sort_games_by_title()
+            self.mark_games_changed()
+        if games_changed or not self.games_file.exists():
+            self.save_games()
+        if total_auto_exceptions:
+            self.save_config()
+        if self._scan_cache_dirty:
+            self.save_scan_cache()
         self._last_auto_exception_count = total_auto_exceptions
 
         return []
@@ -844,10 +1136,12 @@ class GameLibraryManager:
         Returns:
             Tuple of (exceptions_count, removed_libraries) or None if cancelled
         """
-        from dialogs import ScanProgressDialog
+        global _ScanProgressDialog
+        if _ScanProgressDialog is None:
+            from dialogs import ScanProgressDialog as _ScanProgressDialog
 
         # Count libraries (excluding manual)
-        library_count = sum(1 for lib in self.config["libraries"] if lib["name"] != "manual")
+        library_count = len(self.non_manual_libs)
 
         # If no libraries with UI needed, run without dialog
         if library_count == 0:
@@ -855,71 +1149,97 @@ class GameLibraryManager:
             return (self._last_auto_exception_count, removed_libraries)
 
         # Create progress dialog
-        progress_dialog = ScanProgressDialog(parent_window)
+        progress_dialog = _ScanProgressDialog(parent_window)
         progress_dialog.set_library_count(library_count)
 
-        # Result storage for background thread
-        scan_result = {
-            "exceptions_count": 0,
-            "removed_libraries": [],
-            "error": None,
-            "cancelled": False
-        }
+        # The scan thread only overwrites the latest progress tuple (a single
+        # reference store); the poll timer shows whichever one is current
+        latest_progress = None
 
-        def background_scan():
-            """Background thread for scanning"""
-            try:
-                def progress_callback(library_name, progress, games_found):
-                    if not progress_dialog.cancelled:
-                        progress_dialog.update_progress(library_name, progress, games_found)
+        # Scans report every directory; pass on at most ~30 updates a second,
+        # but never drop a library change or the final 100%
+        last_update_time = 0.0
+        last_library_name = None
 
-                def cancel_check():
-                    return progress_dialog.cancelled
+        def progress_callback(library_name, progress, games_found):
+            nonlocal last_update_time, last_library_name, latest_progress
+            if progress_dialog.cancelled:
+                return
+            now = time.monotonic()
+            if (now - last_update_time < self.PROGRESS_UPDATE_INTERVAL and progress < 100
+                    and library_name == last_library_name):
+                return
+            last_update_time = now
+            last_library_name = library_name
+            latest_progress = (library_name, progress, games_found)
 
-                removed_libraries = self.validate_and_scan(
-                    libraries_to_scan, progress_callback, cancel_check
-                )
-                scan_result["exceptions_count"] = self._last_auto_exception_count
-                scan_result["removed_libraries"] = removed_libraries
-                scan_result["cancelled"] = progress_dialog.cancelled
-
-            except Exception as e:
-                scan_result["error"] = e
-            finally:
-                # Handle dialog closing
-                if not scan_result["cancelled"]:
-                    if scan_result["removed_libraries"]:
-                        import wx
-                        wx.CallAfter(progress_dialog.EndModal, wx.ID_OK)
-                    else:
-                        progress_dialog.finish_scan(len(self.games), scan_result["exceptions_count"])
-                else:
-                    import wx
-                    wx.CallAfter(progress_dialog.EndModal, wx.ID_CANCEL)
+        def cancel_check():
+            return progress_dialog.cancelled
 
-        # Start background thread
-        import threading
-        thread = threading.Thread(target=background_scan, daemon=True)
-        thread.start()
+        future = self._scan_pool.submit(
+            self._run_scan, libraries_to_scan, progress_callback, cancel_check
+        )
+
+        import wx
+
+        shown_progress = None
+
+        def on_poll_timer(event):
+            """Show the latest progress and close the dialog once the scan is done"""
+            nonlocal shown_progress
+            update = latest_progress
+            if update is not shown_progress:
+                shown_progress = update
+                progress_dialog.update_progress(*update)
+
+            if not future.done():
+                return
+            poll_timer.Stop()
+
+            # Handle dialog closing
+            if progress_dialog.cancelled:
+                progress_dialog.EndModal(wx.ID_CANCEL)
+            elif future.exception() is None and future.result()[1]:
+                progress_dialog.EndModal(wx.ID_OK)
+            else:
+                exceptions_count = self._last_auto_exception_count if future.exception() is None else 0
+                progress_dialog.finish_scan(len(self.games), exceptions_count)
+
+        poll_timer = wx.Timer(progress_dialog)
+        progress_dialog.Bind(wx.EVT_TIMER, on_poll_timer, poll_timer)
+        poll_timer.Start(int(self.PROGRESS_UPDATE_INTERVAL * 1000))
 
         # Show dialog
         result = progress_dialog.ShowModal()
+        poll_timer.Stop()
         progress_dialog.Destroy()
 
         # Handle results
-        if scan_result["error"]:
-            if isinstance(scan_result["error"], PermissionError):
-                import wx
+        error = future.exception()
+        if error:
+            if isinstance(error, PermissionError):
                 wx.MessageBox(
-                    f"Permission denied accessing:\n{scan_result['error']}",
+                    f"Permission denied accessing:\n{error}",
                     "Permission Error",
                     wx.OK | wx.ICON_ERROR
                 )
             else:
-                raise scan_result["error"]
+                raise error
 
-        if scan_result["cancelled"]:
+        if result == wx.ID_CANCEL:
             return None
 
-        return (scan_result["exceptions_count"], scan_result["removed_libraries"])
+        if error:
+            return (0, [])
+        return future.result()
+
+    def _run_scan(self, libraries_to_scan, progress_callback, cancel_check):
+        """Run validate_and_scan on the scan pool thread.
 
+        Returns:
+            Tuple of (exceptions_count, removed_libraries)
+        """
+        removed_libraries = self.validate_and_scan(
+            libraries_to_scan, progress_callback, cancel_check
+        )
+        return (self._last_auto_exception_count, removed_libraries)
@@ -20,98 +20,59 @@ Main window for Game Chooser application
 """
 
 import wx
-import os
-import subprocess
 import platform
-import webbrowser
-import threading
 import random
 from pathlib import Path
 
 from models import Game
 from library_manager import GameLibraryManager
 from game_list import GameListCtrl
-from dialogs import GameDialog, PreferencesDialog, DeleteGameDialog, FirstTimeSetupDialog
 
-
-class FilterWorker(threading.Thread):
-    """Background thread for filtering games to prevent UI freezing"""
-
-    def __init__(self, games, search_term, tree_criteria, library_filter, callback):
-        super().__init__(daemon=True)
-        self.games = games
-        self.search_term = search_term.lower().strip() if search_term else ""
-        self.tree_criteria = tree_criteria
-        self.library_filter = library_filter  # List of active libraries (empty means all)
-        self.callback = callback
-        self._stop_event = threading.Event()
-
-    def stop(self):
-        """Signal the thread to stop"""
-        self._stop_event.set()
-
-    def run(self):
-        """Filter games in background"""
-        filtered = []
-
-        for game in self.games:
-            # Check if we should stop
-            if self._stop_event.is_set():
-                return
-
-            # Apply library filter
-            # Manual games and web games are always included
-            if game.library_name and game.library_name != "manual" and game.library_name != "":
-                # If library_filter is None, show all (no filtering)
-                # If library_filter is empty list, show none (all unchecked)
-                # If library_filter has items, show only those
-                if self.library_filter is not None and game.library_name not in self.library_filter:
-                    continue
-
-            # Apply tree filter
-            if self.tree_criteria:
-                platform_match = not self.tree_criteria["platforms"] or \
-                                any(p in self.tree_criteria["platforms"] for p in game.platforms)
-                genre_match = not self.tree_criteria["genres"] or \
-                             game.genre in self.tree_criteria["genres"] or \
-                             (game.genre == "" and "Unknown Genre" in self.tree_criteria["genres"])
-                dev_match = not self.tree_criteria["developers"] or \
-                           game.developer in self.tree_criteria["developers"] or \
-                           (game.developer == "" and "Unknown Developer" in self.tree_criteria["developers"])
-                year_match = not self.tree_criteria["years"] or \
-                            game.year in self.tree_criteria["years"] or \
-                            (game.year == "" and "Unknown Year" in self.tree_criteria["years"])
-
-                if not (platform_match and genre_match and dev_match and year_match):
-                    continue
-
-            # Apply search filter
-            if self.search_term:
-                # Exclude "unknown" from all searches
-                if "unknown" in self.search_term:
-                    continue
-                if not any(self.search_term in field.lower() for field in
-                          [game.title, game.developer]):
-                    continue
-
-            filtered.append(game)
-
-        # Call the callback with results if not stopped
-        if not self._stop_event.is_set():
-            wx.CallAfter(self.callback, filtered)
+# dialogs, subprocess and webbrowser are imported where they are first
+# needed, so they stay out of startup unless the window actually uses them
 
 
 class MainFrame(wx.Frame):
     """Main application window"""
+
+    # Tree category key -> key of that category in filter criteria and the filter index
+    TREE_CRITERIA_KEYS = {
+        "platform": "platforms",
+        "genre": "genres",
+        "developer": "developers",
+        "year": "years"
+    }
+
+    # Tree category key -> label of its tree node, also the prefix of saved selection paths
+    TREE_CATEGORY_LABELS = {
+        "platform": "Platform",
+        "genre": "Genre",
+        "developer": "Developer",
+        "year": "Release Year"
+    }
+
+    SEARCH_DELAY_MS = 500  # Pause in typing before the search is applied
+    TREE_FILTER_DELAY_MS = 100  # Coalesces the burst of events from one tree (multi-)selection
+    CONFIG_SAVE_DELAY_MS = 1000  # Idle time before selection state is written to config.json
+    GAMES_SAVE_DELAY_MS = 500  # Delay that batches games.json writes from consecutive edits
     
     def __init__(self):
         super().__init__(None, title="Game Chooser (0)")
         
         self.library_manager = GameLibraryManager()
         self.filtered_games = []
-        self.filter_worker = None  # Background filtering thread
-        self._tree_cache = None  # Cache for tree categories
-        self._games_hash = None  # Hash to detect when games list changes
+        self._tree_cache = None  # Category values shown by the current tree
+        self._tree_revision = None  # library_manager.revision the tree was built at
+        self._sorted_tree_values = {}  # Category key -> (index values dict, its values sorted)
+        self._unpopulated_tree_categories = set()  # Category keys whose values aren't added yet
+        self._tree_category_nodes = {}  # Category label -> its tree node
+        self._tree_item_by_path = {}  # Saved selection path ("Label/Value") -> value node
+        self._filter_index = None  # Tree filter value -> game positions, see get_filter_index()
+        self._filter_index_games = None  # Games list the index was built from
+        self._filter_index_revision = None  # library_manager.revision the index was built at
+        self._filter_index_libraries = set()  # Library names of non-manual games in the index
+        self._last_filter_sig = None  # Identity of the games last shown, see on_filter_complete()
+        self._ui_refresh_pending = None  # None, or whether the queued refresh_ui() rebuilds the libraries menu
         self.dialog_active = False  # Flag to block spurious events when modal dialogs are open
         self.restoring_tree = False  # Flag to block saves during tree restoration
         self.initializing = True  # Flag to prevent focus stealing during startup
@@ -119,6 +80,18 @@ class MainFrame(wx.Frame):
         self.active_libraries = None  # Track active libraries for filtering (None means show all, empty list means show none)
         self.library_menu_items = {}  # Map library names to menu items
 
+        # One-shot timer restarted on each keystroke so filtering runs once typing pauses
+        self.search_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_search_timer, self.search_timer)
+
+        # Coalesces config saves from rapid selection changes into one write
+        self.config_save_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_config_save_timer, self.config_save_timer)
+
+        # Running means games.json has unsaved edits, see schedule_games_save()
+        self.games_save_timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.on_games_save_timer, self.games_save_timer)
+
         # Set up UI
         self.init_ui()
         
@@ -141,6 +114,7 @@ class MainFrame(wx.Frame):
         
         # Menu bar
         self.create_menu_bar()
+        self.create_list_context_menu()
         
         # Search combo box
         search_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -175,9 +149,13 @@ class MainFrame(wx.Frame):
         tree_label.Hide()
         tree_sizer.Add(tree_label, 0, wx.ALL, 0)
 
+        # The root only holds the categories, so it is hidden; LINES_AT_ROOT
+        # keeps expand buttons on the now top-level categories
         self.tree_ctrl = wx.TreeCtrl(tree_panel,
-                                    style=wx.TR_DEFAULT_STYLE | wx.TR_MULTIPLE)
+                                    style=wx.TR_DEFAULT_STYLE | wx.TR_MULTIPLE |
+                                          wx.TR_HIDE_ROOT | wx.TR_LINES_AT_ROOT)
         self.tree_ctrl.Bind(wx.EVT_TREE_SEL_CHANGED, self.on_tree_selection)
+        self.tree_ctrl.Bind(wx.EVT_TREE_ITEM_EXPANDING, self.on_tree_expanding)
         self.tree_ctrl.Bind(wx.EVT_KEY_DOWN, self.on_tree_key)
 
         tree_sizer.Add(self.tree_ctrl, 1, wx.EXPAND)
@@ -208,6 +186,30 @@ class MainFrame(wx.Frame):
         # Populate initial game list
         self.refresh_game_list()
     
+    def create_list_context_menu(self):
+        """Create the game list context menu once; on_list_context reuses it"""
+        self.list_context_menu = wx.Menu()
+
+        launch_item = self.list_context_menu.Append(wx.ID_ANY, "Launch")
+        self.Bind(wx.EVT_MENU, self.on_launch, launch_item)
+
+        edit_item = self.list_context_menu.Append(wx.ID_ANY, "Edit")
+        self.Bind(wx.EVT_MENU, self.on_edit_game, edit_item)
+
+        open_folder_item = self.list_context_menu.Append(wx.ID_ANY, "Open folder")
+        self.Bind(wx.EVT_MENU, self.on_open_folder, open_folder_item)
+
+        delete_item = self.list_context_menu.Append(wx.ID_ANY, "Delete")
+        self.Bind(wx.EVT_MENU, self.on_delete_game, delete_item)
+
+        self.list_context_menu.AppendSeparator()
+
+        add_game_item = self.list_context_menu.Append(wx.ID_ANY, "Add Game")
+        self.Bind(wx.EVT_MENU, self.on_add_game, add_game_item)
+
+        # Items that act on the selected game
+        self.list_context_game_items = [launch_item, edit_item, open_folder_item, delete_item]
+
     def create_menu_bar(self):
         """Create the menu bar"""
         menu_bar = wx.MenuBar()
@@ -315,6 +317,7 @@ class MainFrame(wx.Frame):
     def check_libraries(self):
         """Check if first run and show setup dialog"""
         if self.library_manager.is_first_run:
+            from dialogs import FirstTimeSetupDialog
             dlg = FirstTimeSetupDialog(self, self.library_manager)
             result = dlg.ShowModal()
             dlg.Destroy()
@@ -329,118 +332,111 @@ class MainFrame(wx.Frame):
                 )
 
                 if response == wx.YES:
+                    self.flush_pending_saves()
                     try:
                         scan_result = self.library_manager.scan_with_dialog(self)
 
                         # If scan wasn't cancelled, refresh UI
                         if scan_result is not None:
                             exceptions_count, removed_libraries = scan_result
-
-                            # Handle removed libraries
-                            if removed_libraries:
-                                lib_paths = "\n".join([f"• {lib['name']}: {lib['path']}" for lib in removed_libraries])
-                                message = f"The following library paths were not found and have been removed from your configuration:\n\n{lib_paths}\n\nWould you like to update your library settings?"
-                                if wx.MessageBox(message, "Missing Library Paths Removed",
-                                                wx.YES_NO | wx.ICON_WARNING) == wx.YES:
-                                    self.on_preferences(None)
+                            self.report_removed_libraries(removed_libraries)
                     except PermissionError as e:
                         wx.MessageBox(str(e), "Permission Denied", wx.OK | wx.ICON_ERROR)
 
             # Refresh UI in case they added stuff
             self.refresh_game_list()
-            self.build_tree(force_rebuild=True)
 
         # Always continue to main window (no forced scanning)
         self.initializing = False
         self.game_list.SetFocus()
     
-    def build_tree(self, filters=None, force_rebuild=False, restore_selections=True):
-        """Build the tree control hierarchy with flat 2-level structure using cache"""
+    def build_tree(self, filters=None, restore_selections=True):
+        """Build the tree control hierarchy with flat 2-level structure using the filter index"""
         if filters is None:
             filters = ["platform", "genre", "developer", "year"]
 
         # Store the current filters for dialog state
         self.current_tree_filters = filters
 
-        # Generate a simple hash of games to detect changes
-        current_hash = len(self.library_manager.games)
-        if current_hash > 0:
-            # Include first and last game titles for better change detection
-            current_hash = hash((current_hash,
-                               self.library_manager.games[0].title if self.library_manager.games else "",
-                               self.library_manager.games[-1].title if self.library_manager.games else ""))
-
-        # Check if we can use cached data
-        if not force_rebuild and self._tree_cache is not None and self._games_hash == current_hash:
-            categories = self._tree_cache
-        else:
-            # Collect unique values for each category
-            categories = {
-                "platform": set(),
-                "genre": set(),
-                "developer": set(),
-                "year": set()
-            }
-
-            for game in self.library_manager.games:
-                # Collect platforms
-                if "platform" in filters:
-                    for platform in game.platforms:
-                        categories["platform"].add(platform)
-
-                # Collect genres
-                if "genre" in filters:
-                    genre = game.genre or "Unknown Genre"
-                    categories["genre"].add(genre)
-
-                # Collect developers
-                if "developer" in filters:
-                    developer = game.developer or "Unknown Developer"
-                    categories["developer"].add(developer)
-
-                # Collect years
-                if "year" in filters:
-                    year = game.year or "Unknown Year"
-                    categories["year"].add(year)
-
-            # Cache the results
-            self._tree_cache = categories
-            self._games_hash = current_hash
-
-        # Clear and rebuild tree control
-        self.tree_ctrl.DeleteAllItems()
-        root = self.tree_ctrl.AddRoot("Filters")
-
-        # Category labels and their children
-        category_labels = {
-            "platform": "Platform",
-            "genre": "Genre",
-            "developer": "Developer",
-            "year": "Release Year"
-        }
+        # Category values come from the filter index. It covers all four categories
+        # whichever filters are shown, and is rebuilt whenever the games change
+        filter_index = self.get_filter_index()
+        self._tree_revision = self.library_manager.revision
+        categories = {category_key: filter_index[criteria_key]
+                      for category_key, criteria_key in self.TREE_CRITERIA_KEYS.items()}
+        self._tree_cache = categories  # Read by populate_tree_category() on expand
 
-        for category_key in ["platform", "genre", "developer", "year"]:
-            if category_key in filters and categories[category_key]:
-                # Add category node
-                category_node = self.tree_ctrl.AppendItem(root, category_labels[category_key])
-
-                # Add all values under this category (case-insensitive sort)
-                for value in sorted(categories[category_key], key=str.lower):
-                    self.tree_ctrl.AppendItem(category_node, value)
+        # Freeze so the rebuild and selection restore repaint once
+        self.tree_ctrl.Freeze()
+        try:
+            # Clear and rebuild tree control
+            self.tree_ctrl.DeleteAllItems()
+            self._unpopulated_tree_categories.clear()
+            self._tree_category_nodes.clear()
+            self._tree_item_by_path.clear()
+            root = self.tree_ctrl.AddRoot("Filters")
+
+            for category_key, label in self.TREE_CATEGORY_LABELS.items():
+                if category_key in filters and categories[category_key]:
+                    # Add category node. Its values are added when it is first expanded;
+                    # until then a placeholder child keeps the expander visible
+                    category_node = self.tree_ctrl.AppendItem(root, label)
+                    self.tree_ctrl.SetItemData(category_node, category_key)
+                    self.tree_ctrl.AppendItem(category_node, "")
+                    self._unpopulated_tree_categories.add(category_key)
+                    self._tree_category_nodes[label] = category_node
+
+            # Categories stay collapsed; with the root hidden they show without expanding it
+
+            # Restore saved selections (only if requested)
+            if restore_selections:
+                self.restore_tree_selections()
+        finally:
+            self.tree_ctrl.Thaw()
 
-        # Expand only the root to show categories, but keep all categories collapsed
-        self.tree_ctrl.Expand(root)
+    def populate_tree_category(self, category_node):
+        """Replace a category's placeholder child with its values"""
+        category_key = self.tree_ctrl.GetItemData(category_node)
+        if category_key not in self._unpopulated_tree_categories:
+            return
+        self._unpopulated_tree_categories.discard(category_key)
 
-        # Restore saved selections (only if requested)
-        if restore_selections:
-            self.restore_tree_selections()
+        self.tree_ctrl.Freeze()
+        try:
+            self.tree_ctrl.DeleteChildren(category_node)
+            # Add all values under this category (case-insensitive sort), tagged
+            # with their criteria key so selections can be read without parent walks
+            criteria_key = self.TREE_CRITERIA_KEYS[category_key]
+            values = self._tree_cache[category_key]
+            cached = self._sorted_tree_values.get(category_key)
+            if cached is None or cached[0] is not values:
+                # Tree rebuilds reuse this until the filter index is rebuilt
+                cached = (values, sorted(values, key=str.lower))
+                self._sorted_tree_values[category_key] = cached
+            path_prefix = self.TREE_CATEGORY_LABELS[category_key] + "/"
+            item_by_path = self._tree_item_by_path
+            for value in cached[1]:
+                item = self.tree_ctrl.AppendItem(category_node, value, data=(criteria_key, value))
+                item_by_path[path_prefix + value] = item
+        finally:
+            self.tree_ctrl.Thaw()
+
+    def on_tree_expanding(self, event):
+        """Populate a category the first time it is expanded"""
+        item = event.GetItem()
+        if item.IsOk() and item != self.tree_ctrl.GetRootItem():
+            self.populate_tree_category(item)
+        event.Skip()
     
     def on_tree_selection(self, event):
         """Handle tree selection changes"""
         # Save tree selections (skip during restoration to avoid multiple saves)
         if not self.restoring_tree:
             self.save_tree_selections()
-        self.apply_filters()
+            # Written once selection settles; a range selection fires an event per item
+            self.config_save_timer.StartOnce(self.CONFIG_SAVE_DELAY_MS)
+        # Selecting a range fires an event per item; filter once they settle
+        self.search_timer.StartOnce(self.TREE_FILTER_DELAY_MS)
     
     def on_tree_key(self, event):
         """Handle tree keyboard events"""
@@ -468,51 +464,32 @@ class MainFrame(wx.Frame):
             "years": set()
         }
 
-        # Category label mapping
-        category_mapping = {
-            "Platform": "platforms",
-            "Genre": "genres",
-            "Developer": "developers",
-            "Release Year": "years"
-        }
-
         for item in selections:
-            item_text = self.tree_ctrl.GetItemText(item)
-            parent = self.tree_ctrl.GetItemParent(item)
-
-            # Skip root node
-            if parent == self.tree_ctrl.GetRootItem() or not parent:
-                # This is a category node - ignore for now (could add "select all" logic later)
-                continue
-
-            # Get parent category
-            parent_text = self.tree_ctrl.GetItemText(parent)
-            if parent_text in category_mapping:
-                criteria_key = category_mapping[parent_text]
-                criteria[criteria_key].add(item_text)
+            # Value nodes carry (criteria key, value); the root and category
+            # nodes don't and are ignored for now (could add "select all" logic later)
+            data = self.tree_ctrl.GetItemData(item)
+            if isinstance(data, tuple):
+                criteria_key, value = data
+                criteria[criteria_key].add(value)
 
         return criteria
 
     def save_tree_selections(self):
-        """Save current tree selections to config"""
-        selections = self.tree_ctrl.GetSelections()
+        """Store current tree selections in config (callers write the file)"""
+        # Criteria key -> category label, the first part of a saved path
+        labels = {self.TREE_CRITERIA_KEYS[category_key]: label
+                  for category_key, label in self.TREE_CATEGORY_LABELS.items()}
         paths = []
 
-        for item in selections:
-            item_text = self.tree_ctrl.GetItemText(item)
-            parent = self.tree_ctrl.GetItemParent(item)
-
-            # Skip root node
-            if parent == self.tree_ctrl.GetRootItem() or not parent:
-                continue
-
-            # Build path: "Parent/Child"
-            parent_text = self.tree_ctrl.GetItemText(parent)
-            path = f"{parent_text}/{item_text}"
-            paths.append(path)
+        for item in self.tree_ctrl.GetSelections():
+            # Only value nodes carry (criteria key, value); root and categories are skipped
+            data = self.tree_ctrl.GetItemData(item)
+            if isinstance(data, tuple):
+                criteria_key, value = data
+                # Build path: "Category/Value"
+                paths.append(f"{labels[criteria_key]}/{value}")
 
         self.library_manager.config["SavedState"]["tree_selections"] = paths
-        self.library_manager.save_config()
 
     def restore_tree_selections(self):
         """Restore saved tree selections"""
@@ -527,55 +504,106 @@ class MainFrame(wx.Frame):
             # Clear current selections
             self.tree_ctrl.UnselectAll()
 
-            # Walk tree to find and select items
-            root = self.tree_ctrl.GetRootItem()
-            if not root:
-                return
-
-            # Iterate through category nodes
-            category_item, cookie = self.tree_ctrl.GetFirstChild(root)
-            while category_item:
-                category_text = self.tree_ctrl.GetItemText(category_item)
-
-                # Iterate through child items
-                child_item, child_cookie = self.tree_ctrl.GetFirstChild(category_item)
-                while child_item:
-                    child_text = self.tree_ctrl.GetItemText(child_item)
-                    path = f"{category_text}/{child_text}"
-
-                    if path in saved_paths:
-                        self.tree_ctrl.SelectItem(child_item, True)
-
-                    child_item, child_cookie = self.tree_ctrl.GetNextChild(category_item, child_cookie)
-
-                category_item, cookie = self.tree_ctrl.GetNextChild(root, cookie)
+            # Categories holding saved selections need their values in place
+            for label in {path.partition("/")[0] for path in saved_paths}:
+                category_node = self._tree_category_nodes.get(label)
+                if category_node:
+                    self.populate_tree_category(category_node)
+
+            # Look up each saved path; values no longer in the library are skipped
+            for path in saved_paths:
+                item = self._tree_item_by_path.get(path)
+                if item:
+                    self.tree_ctrl.SelectItem(item, True)
         finally:
             # Always clear the flag
             self.restoring_tree = False
 
     def apply_filters(self):
-        """Apply search and tree filters using background thread"""
-        # Stop any existing filter operation
-        if self.filter_worker and self.filter_worker.is_alive():
-            self.filter_worker.stop()
-            self.filter_worker.join(timeout=0.1)  # Brief wait for cleanup
-
-        search_term = self.search_combo.GetValue()
-        tree_criteria = self.get_tree_selection_criteria()
-
-        # Start new filter operation in background
-        self.filter_worker = FilterWorker(
-            self.library_manager.games,
-            search_term,
-            tree_criteria,
-            self.active_libraries,
-            self.on_filter_complete
-        )
-        self.filter_worker.start()
+        """Apply search and tree filters and show the result"""
+        # Filtering is fast enough to run here: typing and tree selection are
+        # debounced by search_timer, and tree values come from the filter index
+        self.search_timer.Stop()
+        self.on_filter_complete(self.filter_games(self.search_combo.GetValue(),
+                                                  self.get_tree_selection_criteria()))
+
+    def filter_games(self, search_term, tree_criteria):
+        """Get the games matching the search term, tree criteria and active libraries"""
+        self.get_filter_index()
+        games = self._filter_index_games
+        search_term = search_term.lower().strip() if search_term else ""
+        # Searches containing "unknown" never match anything
+        if "unknown" in search_term:
+            return []
+        # None means all libraries, empty list means none. Decided once here so
+        # the loop below only tests libraries when some are actually hidden
+        library_filter = self.active_libraries
+        if library_filter is not None:
+            library_filter = set(library_filter)
+            if self._filter_index_libraries.issubset(library_filter):
+                library_filter = None
+
+        # Nothing to filter: show every game. Copied because populate() sorts in place
+        if (not search_term and library_filter is None
+                and not (tree_criteria and any(tree_criteria.values()))):
+            return list(games)
+
+        # Apply tree filter through the index: OR within a category, AND across
+        # categories. Positions are sorted to keep the library order.
+        if tree_criteria:
+            positions = None
+            for criteria_key in ("platforms", "genres", "developers", "years"):
+                selected = tree_criteria[criteria_key]
+                if not selected:
+                    continue
+                value_index = self._filter_index[criteria_key]
+                matches = set()
+                for value in selected:
+                    matches.update(value_index.get(value, ()))
+                positions = matches if positions is None else positions & matches
+            if positions is not None:
+                games = [games[i] for i in sorted(positions)]
+
+        if library_filter is None:
+            if not search_term:
+                return games  # Only the tree filtered, and it built a new list
+            return [game for game in games if search_term in game.search_text]
+
+        filtered = []
+        for game in games:
+            # Apply library filter
+            # Manual games and web games are always included
+            if not game.is_manual and game.library_name not in library_filter:
+                continue
+
+            # Apply search filter
+            if search_term and search_term not in game.search_text:
+                continue
+
+            filtered.append(game)
+
+        return filtered
 
     def on_filter_complete(self, filtered_games):
-        """Called when background filtering is complete"""
+        """Show the result of apply_filters()"""
+        # Same games as last time (e.g. another letter typed that still matches
+        # the same set): keep the list, its sort and its selection as they are
+        filter_sig = tuple(map(id, filtered_games))
+        if filter_sig == self._last_filter_sig:
+            return
+        self._last_filter_sig = filter_sig
+
         self.filtered_games = filtered_games
+
+        # Freeze so repopulating and reselecting repaint the list once
+        self.game_list.control.Freeze()
+        try:
+            self._show_filtered_games(filtered_games)
+        finally:
+            self.game_list.control.Thaw()
+
+    def _show_filtered_games(self, filtered_games):
+        """Populate the list and restore the selected game"""
         self.game_list.populate(filtered_games)
 
         # Select and focus item for screen reader accessibility
@@ -597,14 +625,56 @@ class MainFrame(wx.Frame):
             self.game_list.Focus(selected_index)
             # Removed SetFocus() - was stealing focus from tree control on every filter change
     
+    def get_filter_index(self):
+        """Get the tree filter index, rebuilding it if the games changed
+
+        Maps each criteria key ("platforms", "genres", ...) to a dict of tree
+        value -> positions in library_manager.games. Empty fields are indexed
+        under the tree's "Unknown ..." labels.
+        """
+        games = self.library_manager.games
+        if (self._filter_index is None
+                or self._filter_index_revision != self.library_manager.revision):
+            by_platform = {}
+            by_genre = {}
+            by_developer = {}
+            by_year = {}
+            for position, game in enumerate(games):
+                for platform_name in game.platforms:
+                    by_platform.setdefault(platform_name, []).append(position)
+                by_genre.setdefault(game.genre or "Unknown Genre", []).append(position)
+                by_developer.setdefault(game.developer or "Unknown Developer", []).append(position)
+                by_year.setdefault(game.year or "Unknown Year", []).append(position)
+
+            self._filter_index = {
+                "platforms": by_platform,
+                "genres": by_genre,
+                "developers": by_developer,
+                "years": by_year
+            }
+            self._filter_index_games = games
+            self._filter_index_revision = self.library_manager.revision
+            self._filter_index_libraries = {game.library_name for game in games if not game.is_manual}
+        return self._filter_index
+
     def refresh_game_list(self):
-        """Refresh the game list display"""
+        """Refresh the game list display, and the tree if the games changed"""
+        # Rebuild a stale tree first so the filters below see its restored selections
+        if self._tree_cache is not None and self._tree_revision != self.library_manager.revision:
+            self.build_tree(self.current_tree_filters)
+
+        # Games may have been edited in place, so always repopulate
+        self._last_filter_sig = None
         self.apply_filters()
         self.update_title()
     
     def on_search_text(self, event):
-        """Handle search text changes immediately"""
-        # Apply filters immediately - virtual list makes this fast
+        """Handle search text changes once typing pauses"""
+        # StartOnce on a running timer restarts it
+        self.search_timer.StartOnce(self.SEARCH_DELAY_MS)
+
+    def on_search_timer(self, event):
+        """Apply filters after the typing or tree selection delay"""
         self.apply_filters()
     
     def on_search_select(self, event):
@@ -621,9 +691,38 @@ class MainFrame(wx.Frame):
         if game:
             self.launch_btn.SetLabel(f"Launch {game.title}")
 
-            # Save selected game
+            # Save selected game once navigation settles
             self.library_manager.config["SavedState"]["last_selected"] = game.title
+            self.config_save_timer.StartOnce(self.CONFIG_SAVE_DELAY_MS)
+
+    def on_config_save_timer(self, event):
+        """Write config changes deferred by config_save_timer"""
+        self.library_manager.save_config()
+
+    def schedule_games_save(self):
+        """Save games.json shortly, so a run of edits or deletes is written once"""
+        self.games_save_timer.StartOnce(self.GAMES_SAVE_DELAY_MS)
+
+    def on_games_save_timer(self, event):
+        """Write games changes deferred by schedule_games_save()"""
+        self.library_manager.save_games()
+
+    def flush_games_save(self):
+        """Write any pending games changes now (before scans, which save games themselves)"""
+        if self.games_save_timer.IsRunning():
+            self.games_save_timer.Stop()
+            self.library_manager.save_games()
+
+    def flush_pending_saves(self):
+        """Write pending config and games changes before a scan starts
+
+        The scan saves both files from its worker thread, and the save timers
+        could otherwise fire while its progress dialog pumps events.
+        """
+        if self.config_save_timer.IsRunning():
+            self.config_save_timer.Stop()
             self.library_manager.save_config()
+        self.flush_games_save()
     
     def on_game_activated(self, event):
         """Handle double-click on game"""
@@ -631,26 +730,12 @@ class MainFrame(wx.Frame):
     
     def on_list_context(self, event):
         """Show context menu for list (supports both mouse and keyboard)"""
-        menu = wx.Menu()
+        menu = self.list_context_menu
 
-        game = self.game_list.get_selected_game()
-        if game:
-            launch_item = menu.Append(wx.ID_ANY, "Launch")
-            self.Bind(wx.EVT_MENU, self.on_launch, launch_item)
-
-            edit_item = menu.Append(wx.ID_ANY, "Edit")
-            self.Bind(wx.EVT_MENU, self.on_edit_game, edit_item)
-
-            open_folder_item = menu.Append(wx.ID_ANY, "Open folder")
-            self.Bind(wx.EVT_MENU, self.on_open_folder, open_folder_item)
-
-            delete_item = menu.Append(wx.ID_ANY, "Delete")
-            self.Bind(wx.EVT_MENU, self.on_delete_game, delete_item)
-
-            menu.AppendSeparator()
-
-        add_game_item = menu.Append(wx.ID_ANY, "Add Game")
-        self.Bind(wx.EVT_MENU, self.on_add_game, add_game_item)
+        # Game actions are only available with a game selected
+        has_game = self.game_list.get_selected_game() is not None
+        for item in self.list_context_game_items:
+            item.Enable(has_game)
 
         # Determine if this is a mouse event or keyboard event
         if hasattr(event, 'GetEventType') and event.GetEventType() == wx.wxEVT_LIST_ITEM_RIGHT_CLICK:
@@ -668,8 +753,6 @@ class MainFrame(wx.Frame):
             else:
                 # No selection, show at default position
                 self.PopupMenu(menu)
-
-        menu.Destroy()
     
     def on_list_key(self, event):
         """Handle list keyboard events"""
@@ -694,12 +777,12 @@ class MainFrame(wx.Frame):
             return
 
         # Skip web games - no local folder to open
-        if game.launch_path.startswith("http"):
+        if game.is_web:
             return
 
         # Get full path to game
-        full_path = self.library_manager.get_full_path(game)
-        if not full_path or not Path(full_path).exists():
+        full_path = self.library_manager.get_existing_full_path(game)
+        if not full_path:
             wx.MessageBox("Game folder not found.",
                         "Folder Not Found", wx.OK | wx.ICON_ERROR)
             return
@@ -709,6 +792,7 @@ class MainFrame(wx.Frame):
 
         # Open folder with platform-specific command
         try:
+            import subprocess
             system = platform.system()
             if system == "Windows":
                 # Open folder and highlight the executable
@@ -723,7 +807,7 @@ class MainFrame(wx.Frame):
     def launch_game(self, game):
         """Launch a specific game"""
         # Check platform compatibility for non-web games
-        if not game.launch_path.startswith("http"):
+        if not game.is_web:
             # Get current platform
             current_system = platform.system()
 
@@ -748,13 +832,14 @@ class MainFrame(wx.Frame):
                 )
                 return
 
-        if game.launch_path.startswith("http"):
+        if game.is_web:
             # Web game
+            import webbrowser
             webbrowser.open(game.launch_path)
         else:
             # Regular game
-            full_path = self.library_manager.get_full_path(game)
-            if not full_path or not Path(full_path).exists():
+            full_path = self.library_manager.get_existing_full_path(game)
+            if not full_path:
                 wx.MessageBox("Game executable not found. Please locate the game.",
                             "File Not Found", wx.OK | wx.ICON_ERROR)
 
@@ -764,30 +849,38 @@ class MainFrame(wx.Frame):
                     new_path = dlg.GetPath()
 
                     # Validate path is in a library
-                    valid = False
-                    for lib in self.library_manager.config["libraries"]:
-                        if new_path.startswith(lib["path"]):
-                            # Update game path
-                            rel_path = Path(new_path).relative_to(Path(lib["path"]).parent)
-                            game.launch_path = str(rel_path).replace(os.sep, '/')
-                            self.library_manager.save_games()
-                            valid = True
-                            break
-
-                    if not valid:
+                    library = self.library_manager.find_library_for_path(new_path)
+                    if library:
+                        # Update game path, relative to the library root like scanned games.
+                        # Matched the same way as find_library_for_path(), so case and
+                        # separators in the library path don't matter
+                        rel_path = self.library_manager.path_manager.to_library_relative(new_path, [library])
+                        if rel_path is not None:
+                            game.launch_path = rel_path
+                            game.library_name = library["name"]
+                        else:
+                            # Resolving links moved it out of the library; keep it user-managed
+                            game.launch_path = new_path
+                            game.library_name = "manual"
+                        self.library_manager.mark_games_changed()
+                        self.schedule_games_save()
+                    else:
                         wx.MessageBox("Selected file is not in a configured game library.",
                                     "Invalid Location", wx.OK | wx.ICON_ERROR)
-                        return
                 dlg.Destroy()
                 return
 
             # Launch the game
             try:
+                import subprocess
                 game_dir = str(Path(full_path).parent)
                 system = platform.system()
                 if system == "Darwin" and full_path.endswith(".app"):
-                    # macOS .app bundle
-                    subprocess.Popen(["open", "-a", full_path], cwd=game_dir)
+                    # macOS .app bundle. open hands the app to Launch Services, so no
+                    # cwd is needed; with an absolute path, no cwd and close_fds off,
+                    # Popen can posix_spawn instead of forking this whole process
+                    # (Python's own descriptors are non-inheritable anyway)
+                    subprocess.Popen(["/usr/bin/open", "-a", full_path], close_fds=False)
                 else:
                     # Regular executable
                     subprocess.Popen([full_path], cwd=game_dir)
@@ -796,6 +889,7 @@ class MainFrame(wx.Frame):
                 self.Iconize(True)
 
             except Exception as e:
+                game.invalidate_cache()  # Check the path again next time
                 wx.MessageBox(f"Failed to launch game: {e}",
                             "Launch Error", wx.OK | wx.ICON_ERROR)
 
@@ -826,7 +920,7 @@ class MainFrame(wx.Frame):
         # Get games compatible with current platform (or web games)
         compatible_games = [
             game for game in self.filtered_games
-            if game.launch_path.startswith("http") or current_platform in game.platforms
+            if game.is_web or current_platform in game.platforms
         ]
 
         if not compatible_games:
@@ -856,13 +950,15 @@ class MainFrame(wx.Frame):
         if not game:
             return
 
+        from dialogs import GameDialog
         dlg = GameDialog(self, self.library_manager, game)
 
         # Block spurious selection events while modal dialog is active
         self.dialog_active = True
         try:
             if dlg.ShowModal() == wx.ID_OK:
-                self.library_manager.save_games()
+                self.library_manager.mark_games_changed()
+                self.schedule_games_save()
                 self.refresh_game_list()
         finally:
             self.dialog_active = False
@@ -878,6 +974,7 @@ class MainFrame(wx.Frame):
         current_index = self.game_list.GetFirstSelected()
 
         # Show custom delete dialog
+        from dialogs import DeleteGameDialog
         dlg = DeleteGameDialog(self, game.title)
 
         # Block spurious selection events while modal dialog is active
@@ -891,7 +988,8 @@ class MainFrame(wx.Frame):
         if result == wx.ID_YES:
             # Delete without adding to exceptions
             self.library_manager.games.remove(game)
-            self.library_manager.save_games()
+            self.library_manager.mark_games_changed()
+            self.schedule_games_save()
             self.refresh_game_list()
 
             # Select previous item to stay in same area of list
@@ -904,7 +1002,8 @@ class MainFrame(wx.Frame):
             # Delete and add to exceptions
             self.library_manager.add_to_exceptions(game)
             self.library_manager.games.remove(game)
-            self.library_manager.save_games()
+            self.library_manager.mark_games_changed()
+            self.schedule_games_save()
             self.refresh_game_list()
 
             # Select previous item to stay in same area of list
@@ -915,6 +1014,7 @@ class MainFrame(wx.Frame):
     
     def on_add_game(self, event):
         """Add a new game"""
+        from dialogs import GameDialog
         dlg = GameDialog(self, self.library_manager)
 
         # Block spurious selection events while modal dialog is active
@@ -922,7 +1022,8 @@ class MainFrame(wx.Frame):
         try:
             if dlg.ShowModal() == wx.ID_OK:
                 self.library_manager.games.append(dlg.game)
-                self.library_manager.save_games()
+                self.library_manager.mark_games_changed()
+                self.schedule_games_save()
                 self.refresh_game_list()
         finally:
             self.dialog_active = False
@@ -976,8 +1077,7 @@ class MainFrame(wx.Frame):
         self.library_menu_items.clear()
 
         # Get all libraries (excluding manual)
-        libraries = [lib for lib in self.library_manager.config["libraries"]
-                    if lib["name"] != "manual"]
+        libraries = self.library_manager.non_manual_libs
 
         # Initialize active_libraries if None (first time setup)
         if self.active_libraries is None:
@@ -1015,23 +1115,47 @@ class MainFrame(wx.Frame):
 
     def on_preferences(self, event):
         """Show preferences dialog"""
+        # Applying preferences may rescan, which saves from its worker thread
+        self.flush_pending_saves()
+        from dialogs import PreferencesDialog
         dlg = PreferencesDialog(self, self.library_manager)
 
         # Block spurious selection events while modal dialog is active
         self.dialog_active = True
         try:
-            if dlg.ShowModal() == wx.ID_OK:
+            dlg.ShowModal()
+            # Apply may have changed things even if the dialog was then cancelled
+            if dlg.libraries_changed or dlg.games_changed:
                 # Defer UI refresh to avoid blocking the dialog close
-                wx.CallAfter(self.refresh_ui_after_preferences)
+                self.schedule_ui_refresh(dlg.libraries_changed)
         finally:
             self.dialog_active = False
             dlg.Destroy()
 
-    def refresh_ui_after_preferences(self):
-        """Refresh UI after preferences dialog closes"""
-        self.refresh_game_list()
-        self.build_tree(force_rebuild=True)
-        self.build_libraries_menu()
+    def schedule_ui_refresh(self, libraries_changed=True):
+        """Run refresh_ui() once pending events (e.g. a closing dialog's repaint) are handled
+
+        Requests made before it runs are merged into a single refresh.
+        """
+        if self._ui_refresh_pending is None:
+            self._ui_refresh_pending = libraries_changed
+            wx.CallAfter(self.refresh_ui)
+        else:
+            self._ui_refresh_pending = self._ui_refresh_pending or libraries_changed
+
+    def refresh_ui(self):
+        """Refresh the list, tree and (if libraries changed) libraries menu"""
+        libraries_changed = self._ui_refresh_pending
+        self._ui_refresh_pending = None
+        # The tree and list freeze themselves; freezing the frame as well makes
+        # the tree rebuild, list repopulate and title change one repaint
+        self.Freeze()
+        try:
+            self.refresh_game_list()
+            if libraries_changed:
+                self.build_libraries_menu()
+        finally:
+            self.Thaw()
     
     def on_refresh(self, event):
         """Refresh/rescan libraries"""
@@ -1039,31 +1163,40 @@ class MainFrame(wx.Frame):
         if not self.library_manager.config["libraries"]:
             return
 
+        # The scan saves from its worker thread
+        self.flush_pending_saves()
+
         try:
+            revision_before = self.library_manager.revision
             result = self.library_manager.scan_with_dialog(self)
 
-            # If scan was cancelled, just refresh the UI and continue without showing dialogs
+            # Refresh only if the scan changed games; removing a missing library
+            # counts as a change, so the libraries menu is rebuilt with the list
+            if self.library_manager.revision != revision_before:
+                self.schedule_ui_refresh()
+
+            # If scan was cancelled, continue without showing dialogs
             if result is None:
-                self.refresh_game_list()
-                self.build_tree(force_rebuild=True)
-                self.build_libraries_menu()
                 return
 
             exceptions_count, removed_libraries = result
-            self.refresh_game_list()
-            self.build_tree(force_rebuild=True)
-            self.build_libraries_menu()
-            
+
             # Check for removed libraries first
-            if removed_libraries:
-                lib_paths = "\n".join([f"• {lib['name']}: {lib['path']}" for lib in removed_libraries])
-                message = f"The following library paths were not found and have been removed from your configuration:\n\n{lib_paths}\n\nWould you like to update your library settings?"
-                if wx.MessageBox(message, "Missing Library Paths Removed", 
-                                wx.YES_NO | wx.ICON_WARNING) == wx.YES:
-                    self.on_preferences(None)
+            self.report_removed_libraries(removed_libraries)
         
         except PermissionError as e:
             wx.MessageBox(str(e), "Permission Denied", wx.OK | wx.ICON_ERROR)
+
+    def report_removed_libraries(self, removed_libraries):
+        """Tell the user about missing libraries a scan removed and offer preferences"""
+        if not removed_libraries:
+            return
+
+        lib_paths = "\n".join([f"• {lib['name']}: {lib['path']}" for lib in removed_libraries])
+        message = f"The following library paths were not found and have been removed from your configuration:\n\n{lib_paths}\n\nWould you like to update your library settings?"
+        if wx.MessageBox(message, "Missing Library Paths Removed",
+                        wx.YES_NO | wx.ICON_WARNING) == wx.YES:
+            self.on_preferences(None)
     
     def on_exit(self, event):
         """Exit application"""
@@ -1078,48 +1211,57 @@ class MainFrame(wx.Frame):
         """Load saved window state"""
         state = self.library_manager.config["SavedState"]
 
-        # Window size and position
-        if state["window_size"]:
-            self.SetSize(state["window_size"])
-        else:
-            # Default to 50% of screen
-            display = wx.Display()
-            rect = display.GetClientArea()
-            self.SetSize(rect.width // 2, rect.height // 2)
-
-        if state["window_position"]:
-            self.SetPosition(state["window_position"])
-        else:
-            self.Centre()
+        # Freeze so restoring the layout and building the tree repaint once;
+        # setters are skipped when the control already has the saved value
+        self.Freeze()
+        try:
+            # Window size and position
+            if state["window_size"]:
+                if tuple(self.GetSize()) != tuple(state["window_size"]):
+                    self.SetSize(state["window_size"])
+            else:
+                # Default to 50% of screen
+                display = wx.Display()
+                rect = display.GetClientArea()
+                self.SetSize(rect.width // 2, rect.height // 2)
+
+            if state["window_position"]:
+                if tuple(self.GetPosition()) != tuple(state["window_position"]):
+                    self.SetPosition(state["window_position"])
+            else:
+                self.Centre()
 
-        # Splitter position
-        if state["splitter_position"]:
-            self.splitter.SetSashPosition(state["splitter_position"])
-        else:
-            # Default 50/50 split
-            width = self.GetSize()[0]
-            self.splitter.SetSashPosition(width // 2)
+            # Splitter position
+            if state["splitter_position"]:
+                if self.splitter.GetSashPosition() != state["splitter_position"]:
+                    self.splitter.SetSashPosition(state["splitter_position"])
+            else:
+                # Default 50/50 split
+                width = self.GetSize()[0]
+                self.splitter.SetSashPosition(width // 2)
 
-        # Search term
-        if state["last_search"]:
-            self.search_combo.SetValue(state["last_search"])
+            # Search term
+            if state["last_search"] and self.search_combo.GetValue() != state["last_search"]:
+                self.search_combo.SetValue(state["last_search"])
 
-        # Tree filters
-        if state["tree_filters"]:
-            self.current_tree_filters = state["tree_filters"]
+            # Tree filters
+            if state["tree_filters"]:
+                self.current_tree_filters = state["tree_filters"]
 
-        # Active libraries
-        if "active_libraries" in state:
-            self.active_libraries = state["active_libraries"]
+            # Active libraries
+            if "active_libraries" in state:
+                self.active_libraries = state["active_libraries"]
 
-        # Build tree with saved filters (without restoring selections yet)
-        self.build_tree(filters=self.current_tree_filters, restore_selections=False)
+            # Build tree with saved filters (without restoring selections yet)
+            self.build_tree(filters=self.current_tree_filters, restore_selections=False)
 
-        # Update menu item check states based on current filters
-        self.update_filter_menu_state()
+            # Update menu item check states based on current filters
+            self.update_filter_menu_state()
 
-        # Rebuild libraries menu with current state
-        self.build_libraries_menu()
+            # Rebuild libraries menu with current state
+            self.build_libraries_menu()
+        finally:
+            self.Thaw()
     
     def save_state(self):
         """Save current window state"""
@@ -1146,7 +1288,9 @@ class MainFrame(wx.Frame):
     
     def on_close(self, event):
         """Handle window close"""
+        self.search_timer.Stop()
+        self.config_save_timer.Stop()  # save_state() writes the pending config
         self.save_state()
-        self.library_manager.save_games()
-        self.library_manager.save_config()
+        # Every other game change was saved when it was made
+        self.flush_games_save()
         self.Destroy()
\ No newline at end of file
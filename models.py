@@ -19,20 +19,85 @@
 Data models for Game Chooser application
 """
 
+import time
+from sys import intern
 from typing import List, Dict, Any
 
 
+def _intern(value):
+    """Intern a string; anything else (e.g. a hand-edited null) is returned as is"""
+    return intern(value) if type(value) is str else value
+
+
 class Game:
     """Represents a game in the library"""
+
+    # Libraries can hold tens of thousands of games; slots drop the per-instance dict
+    __slots__ = ("title", "genre", "developer", "year", "platforms", "_launch_path", "_is_web",
+                 "library_name", "_search_text", "_resolved_path", "_resolved_at")
+
+    # Order of the values in to_row()/from_row(); games.json records it as "fields"
+    ROW_FIELDS = ("title", "genre", "developer", "year", "platforms", "launch_path", "library_name")
+
     def __init__(self, title="", genre="", developer="", year="",
                  platforms=None, launch_path="", library_name=""):
         self.title = title
         self.genre = genre
         self.developer = developer
         self.year = year
-        self.platforms = platforms or []
+        self.platforms = tuple(platforms) if platforms else ()  # Replaced, never mutated
         self.launch_path = launch_path
         self.library_name = library_name
+        self._search_text = None
+        self._resolved_at = 0.0
+
+    @property
+    def launch_path(self):
+        """Library-relative path, absolute path for user-managed games, or URL"""
+        return self._launch_path
+
+    @launch_path.setter
+    def launch_path(self, value):
+        self._launch_path = value
+        self._is_web = value.startswith("http")
+        self._resolved_path = None
+
+    @property
+    def is_web(self):
+        """True for web games (launch_path is a URL); kept in sync by the launch_path setter"""
+        return self._is_web
+
+    @property
+    def is_manual(self):
+        """True for user-managed games that don't belong to a scanned library"""
+        return not self.library_name or self.library_name == "manual"
+
+    @property
+    def search_text(self):
+        """Lowercased title and developer joined by a unit separator for substring search
+
+        The separator can't be typed into the search box, so a match never spans
+        two fields. Computed once per edit.
+        """
+        if self._search_text is None:
+            self._search_text = self.title.lower() + "\x1f" + self.developer.lower()
+        return self._search_text
+
+    def invalidate_cache(self):
+        """Drop cached derived values; call after editing the game"""
+        self._search_text = None
+        self._resolved_path = None
+
+    def get_cached_full_path(self, max_age):
+        """Return the full path last verified to exist, if checked within max_age seconds"""
+        if self._resolved_path is not None and time.monotonic() - self._resolved_at < max_age:
+            return self._resolved_path
+        return None
+
+    def set_cached_full_path(self, full_path):
+        """Remember a full path that was just verified to exist (not persisted)"""
+        self._resolved_path = full_path
+        self._resolved_at = time.monotonic()
     
     def to_dict(self):
         return {
@@ -47,12 +112,32 @@ class Game:
     
     @classmethod
     def from_dict(cls, data):
+        # Genres, developers, years, platforms and library names repeat across
+        # many games; interning keeps one string object for each value
+        get = data.get  # Looked up once rather than for each field
         return cls(
-            title=data.get("title", ""),
-            genre=data.get("genre", ""),
-            developer=data.get("developer", ""),
-            year=data.get("year", ""),
-            platforms=data.get("platforms", []),
-            launch_path=data.get("launch_path", ""),
-            library_name=data.get("library_name", "")
-        )
\ No newline at end of file
+            title=get("title", ""),
+            genre=_intern(get("genre", "")),
+            developer=_intern(get("developer", "")),
+            year=_intern(get("year", "")),
+            # A hand-edited null is read as empty rather than failing the load
+            platforms=tuple(_intern(p) for p in get("platforms") or ()),
+            launch_path=get("launch_path") or "",
+            library_name=_intern(get("library_name", ""))
+        )
+
+    def to_row(self):
+        """Values of to_dict() in ROW_FIELDS order, for saving many games compactly"""
+        return (self.title, self.genre, self.developer, self.year, self.platforms,
+                self._launch_path, self.library_name)
+
+    @classmethod
+    def from_row(cls, row):
+        """Create a game from a to_row() sequence (a JSON array once loaded)
+
+        Raises ValueError if the row doesn't have one value per ROW_FIELDS entry.
+        """
+        title, genre, developer, year, platforms, launch_path, library_name = row
+        return cls(title, _intern(genre), _intern(developer), _intern(year),
+                   tuple(_intern(p) for p in platforms or ()), launch_path or "",
+                   _intern(library_name))
\ No newline at end of file
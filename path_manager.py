@@ -17,11 +17,15 @@
 import os
 import stat
 import platform
+from functools import lru_cache
 from pathlib import Path
 
 class PathManager:
     """Centralized path operations and normalization."""
 
+    EXECUTABLE_SUFFIXES = ('.exe', '.bat')  # Windows executables and batch files
+    APP_SUFFIX = '.app'  # macOS app bundles (directories)
+
     @staticmethod
     def normalize(path):
         """
@@ -37,6 +41,21 @@ class PathManager:
             path = str(path)
         return path.replace('\\', '/').strip()
 
+    @staticmethod
+    def comparison_key(path):
+        """
+        Build a key for comparing paths the way the filesystem does.
+
+        Case-insensitive on Windows (NTFS), exact elsewhere.
+
+        Args:
+            path: Path string
+
+        Returns:
+            Normalized string suitable for dict lookups
+        """
+        return os.path.normcase(os.path.normpath(path))
+
     @staticmethod
     def to_library_relative(full_path, library_paths):
         """
@@ -49,20 +68,30 @@ class PathManager:
         Returns:
             Library-relative path string or None if not in any library
         """
-        full_path = Path(full_path).resolve()
+        full_path = str(Path(full_path).resolve())
+        full_key = PathManager.comparison_key(full_path)
 
         for lib in library_paths:
-            lib_path = Path(lib["path"]).resolve()
-            try:
-                rel_path = full_path.relative_to(lib_path)
-                return PathManager.normalize(rel_path)
-            except ValueError:
-                continue
+            root_key = PathManager._resolved_root_key(lib["path"])
+            if full_key == root_key:
+                return "."
+            # Keys keep the resolved path's length, so the prefix slices the original
+            if full_key.startswith(root_key + os.sep):
+                return PathManager.normalize(full_path[len(root_key) + 1:])
 
         return None
 
     @staticmethod
-    def get_full_path(launch_path, library_paths, library_name):
+    @lru_cache(maxsize=64)
+    def _resolved_root_key(lib_path):
+        """Comparison key of a resolved library root, without a trailing separator
+
+        Cached so converting many paths resolves each library root once.
+        """
+        return PathManager.comparison_key(str(Path(lib_path).resolve())).rstrip(os.sep)
+
+    @staticmethod
+    def get_full_path(launch_path, library_paths, library_name, paths_by_name=None):
         """
         Convert a library-relative path to absolute.
 
@@ -70,6 +99,8 @@ class PathManager:
             launch_path: Library-relative path
             library_paths: List of library path dictionaries
             library_name: Name of the library containing the game
+            paths_by_name: Optional dict of library name -> path, built once by
+                callers converting many games to skip the search of library_paths
 
         Returns:
             Absolute path as string or None if library not found
@@ -82,6 +113,10 @@ class PathManager:
             return launch_path
 
         # Find library
+        if paths_by_name is not None:
+            lib_path = paths_by_name.get(library_name)
+            return str(Path(lib_path) / launch_path) if lib_path is not None else None
+
         for lib in library_paths:
             if lib["name"] == library_name:
                 lib_path = Path(lib["path"])
@@ -99,17 +134,21 @@ class PathManager:
         Linux support has been removed for simplicity.
 
         Args:
-            path: Path object to check
+            path: Path object, or os.DirEntry from a scan (its type checks
+                reuse the directory read instead of another stat)
 
         Returns:
             bool: True if file is a game executable
         """
+        # Check the name first so only candidates are stat-ed
+        name = path.name.lower()
+
         # macOS .app bundles (directories)
-        if path.suffix.lower() == '.app' and path.is_dir():
-            return True
+        if name.endswith(PathManager.APP_SUFFIX):
+            return path.is_dir()
 
         # Windows executables and batch files only
-        if path.is_file() and path.suffix.lower() in ['.exe', '.bat']:
-            return True
+        if name.endswith(PathManager.EXECUTABLE_SUFFIXES):
+            return path.is_file()
 
         return False
\ No newline at end of file
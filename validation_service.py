@@ -14,8 +14,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <https://www.gnu.org/licenses/>.
 
+import errno
+import os
 import re
-from pathlib import Path
+import stat
+
+# Stat errors that Path.exists() reports as a missing path: no such file, not a
+# directory, bad descriptor, symlink loop; on Windows, device not ready, invalid
+# name and name that cannot be resolved
+_MISSING_PATH_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+_MISSING_PATH_WINERRORS = (21, 123, 1921)
+
+# Basic URL pattern for validate_url(), compiled once at import
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?'  # domain
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE
+)
 
 class ValidationService:
     """Centralized validation logic for game data."""
@@ -47,14 +62,11 @@ class ValidationService:
         if not url:
             return False, "URL cannot be empty"
 
-        # Basic URL pattern
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?'  # domain
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE
-        )
+        # Cheap scheme check first; the pattern only accepts http(s) URLs
+        if not url[:8].lower().startswith(("http://", "https://")):
+            return False, "Invalid URL format"
 
-        if not url_pattern.match(url):
+        if not _URL_RE.match(url):
             return False, "Invalid URL format"
 
         return True, None
@@ -70,20 +82,28 @@ class ValidationService:
         if not path:
             return False, "Path cannot be empty"
 
-        try:
-            p = Path(path)
-
-            if must_exist and not p.exists():
-                return False, f"Path does not exist: {path}"
-
-            if must_exist and not p.is_file():
-                return False, f"Path is not a file: {path}"
-
+        if not must_exist:
             return True, None
 
+        # One stat answers both "exists" and "is a file"
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            if (e.errno in _MISSING_PATH_ERRNOS
+                    or getattr(e, "winerror", None) in _MISSING_PATH_WINERRORS):
+                return False, f"Path does not exist: {path}"
+            return False, f"Invalid path: {str(e)}"
+        except ValueError:
+            # Embedded null character, which Path.exists() also reported as missing
+            return False, f"Path does not exist: {path}"
         except Exception as e:
             return False, f"Invalid path: {str(e)}"
 
+        if not stat.S_ISREG(st.st_mode):
+            return False, f"Path is not a file: {path}"
+
+        return True, None
+
     @staticmethod
     def validate_year(year):
         """